@@ -10,10 +10,11 @@ Gelişmiş ZIP onarım ve kurtarma aracı.
 - OneDrive / Windows ZIP64 "total_disks = 0" bug fix
 - CRC hatalarını görmezden gelerek büyük dosyaları (10GB+) bile mümkün olduğunca çıkar
 - Çıkarılan dosyalardan temiz, tekrar oluşturulmuş ZIP üret
-- AUTO pipeline: check → ZIP64 fix → best-effort extract → rebuild
+- AUTO pipeline: ZIP64 fix → check → best-effort extract → rebuild
 
 Kullanım örnekleri:
     python zip_doctor.py broken.zip --mode auto --out-dir workdir
+    python zip_doctor.py broken.zip --mode auto --out-dir workdir --fuse
     python zip_doctor.py broken.zip --mode check
     python zip_doctor.py broken.zip --mode fixzip64
     python zip_doctor.py broken.zip --mode extract --out-dir extracted
@@ -21,14 +22,19 @@ Kullanım örnekleri:
 """
 
 import argparse
-import mmap
 import os
+import shutil
 import struct
 import sys
+import threading
 import traceback
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List
+from typing import BinaryIO, Deque, Dict, Iterator, Optional, List, Set, Tuple, Union
 
 
 # ==========================
@@ -40,24 +46,380 @@ ZIP_LOCAL_HEADER_SIG = 0x04034B50    # PK\x03\x04
 ZIP_CENTRAL_DIR_SIG = 0x02014B50     # PK\x01\x02
 ZIP_EOCD_SIG = 0x06054B50            # PK\x05\x06
 
+ZIP_FLAG_DATA_DESCRIPTOR = 0x08      # general purpose bit 3: CRC/boyutlar veriden sonra
+
+# Byte dizisi olarak aranan imzalar (her çağrıda struct.pack ile üretilmez)
+_ZIP64_LOCATOR_SIG_BYTES = b"PK\x06\x07"
+_ZIP_EOCD_SIG_BYTES = b"PK\x05\x06"
+
+# Sabit yapılar için önceden derlenmiş struct'lar (format her çağrıda yeniden parse edilmez)
+_U32LE = struct.Struct("<I")
+_LOCATOR = struct.Struct("<IIQI")                # ZIP64 EOCD locator (20 byte)
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")    # Local file header (30 byte)
+
+# Rebuild sırasında bellekte (process pool ile) paralel sıkıştırılacak azami dosya boyutu.
+# Daha büyük dosyalar bellek şişmesin diye streaming z.write yoluyla yazılır.
+PARALLEL_DEFLATE_MAX_SIZE = 4 * 1024 * 1024  # 4MB
+
+# Windows'ta ProcessPoolExecutor en fazla 61 işçi kabul eder (WaitForMultipleObjects sınırı)
+WINDOWS_MAX_PROCESS_WORKERS = 61
+
+# Paralel deflate'te işçi başına aynı anda bekleyebilecek iş sayısı (bellek sınırı)
+PARALLEL_DEFLATE_IN_FLIGHT = 2
+
+# Zaten sıkıştırılmış veri içeren uzantılar: rebuild'de DEFLATE denenmeden STORE olarak eklenir
+STORED_EXTENSIONS = frozenset({
+    ".zip", ".jpg", ".jpeg", ".png", ".webp", ".mp3", ".mp4", ".mkv",
+    ".gz", ".bz2", ".xz", ".zst", ".7z", ".rar",
+})
+
+# ZIP64 locator'ın aranacağı dosya sonu penceresi:
+# locator (20 byte) + EOCD (22 byte) + azami yorum (65535 byte)
+ZIP64_LOCATOR_SEARCH_SIZE = 20 + 22 + 0xFFFF
+
+# Extract kopyalama tamponu ve hata sonrası kurtarma için küçük chunk boyutu
+EXTRACT_BUFFER_SIZE = 8 * 1024 * 1024  # 8MB
+SALVAGE_CHUNK_SIZE = 64 * 1024          # 64KB
+
+# Bu boyuttan büyük çıkarılan dosyalar için disk alanı önceden ayrılır
+PREALLOCATE_MIN_SIZE = 16 * 1024 * 1024  # 16MB
+
+# DEFLATE'in teorik azami sıkıştırma oranı (~1032:1); bunu aşan boyut bilgisi bozuk sayılır
+MAX_DEFLATE_RATIO = 1032
+
+# Dosya başına log satırları bu kadar biriktikten sonra tek seferde yazılır
+LOG_BATCH_SIZE = 256
+
+# Varsayılan dosya sistemi büyük/küçük harf duyarsız (NTFS, APFS): "A.txt" ve "a.txt" aynı dosya
+CASE_INSENSITIVE_FS = sys.platform in ("win32", "darwin")
+
 
 # ==========================
 #  Yardımcı Fonksiyonlar
 # ==========================
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB")
+
+
 def human_size(num: int) -> str:
-    """Boyut formatı (KB, MB, GB, TB...)."""
-    n = float(num)
-    for unit in ["B", "KB", "MB", "GB", "TB", "PB"]:
-        if n < 1024.0:
-            return f"{n:.1f} {unit}"
-        n /= 1024.0
-    return f"{n:.1f} EB"
+    """Boyut formatı (KB, MB, GB, TB...). Birim, döngü yerine bit_length ile seçilir."""
+    if num <= 0:
+        return f"{float(num):.1f} B"
+    unit_idx = min(len(_SIZE_UNITS) - 1, (num.bit_length() - 1) // 10)
+    return f"{num / (1 << (unit_idx * 10)):.1f} {_SIZE_UNITS[unit_idx]}"
+
+
+class BatchedLogger:
+    """
+    Dosya başına basılan sık log satırlarını bellekte toplayıp toplu halde yazar.
+    Anlık satırlar (emit) önce bekleyenleri boşaltır, böylece çıktı sırası korunur.
+    Worker thread'lerden de güvenle çağrılabilir.
+    """
+
+    def __init__(self, batch_size: int = LOG_BATCH_SIZE) -> None:
+        self.batch_size = batch_size
+        self.buf: List[str] = []
+        self._lock = threading.Lock()
+
+    def log(self, msg: str) -> None:
+        with self._lock:
+            self.buf.append(msg)
+            if len(self.buf) >= self.batch_size:
+                self._flush_locked()
+
+    def emit(self, msg: str) -> None:
+        with self._lock:
+            self.buf.append(msg)
+            self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self.buf:
+            sys.stdout.write("\n".join(self.buf) + "\n")
+            sys.stdout.flush()
+            self.buf.clear()
+
+
+_logger = BatchedLogger()
 
 
 def log(msg: str) -> None:
     """Ortak log fonksiyonu."""
-    print(msg)
+    _logger.emit(msg)
+
+
+def log_entry(msg: str) -> None:
+    """Giriş/dosya başına log satırı (döngülerde kullanılır, toplu yazılır)."""
+    _logger.log(msg)
+
+
+@contextmanager
+def _open_zip(source: Union[Path, zipfile.ZipFile]) -> Iterator[zipfile.ZipFile]:
+    """
+    Path verilirse ZIP'i okuma modunda açıp iş bitince kapatır.
+    Zaten açık bir ZipFile verilirse olduğu gibi kullanır (kapatmak çağıranın işi).
+    """
+    if isinstance(source, zipfile.ZipFile):
+        yield source
+        return
+    with zipfile.ZipFile(source, "r", allowZip64=True) as z:
+        yield z
+
+
+def _source_path(source: Union[Path, zipfile.ZipFile]) -> Path:
+    """Log ve dosya işlemleri için kaynağın dosya yolunu döndürür."""
+    if isinstance(source, zipfile.ZipFile):
+        return Path(source.filename)
+    return source
+
+
+def _fadvise(f: BinaryIO, advice: str) -> None:
+    """
+    Çekirdeğe dosya erişim deseni ipucu verir (os.POSIX_FADV_* adıyla).
+    posix_fadvise olmayan platformlarda (Windows, macOS) sessizce geçer.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, getattr(os, advice))
+    except (AttributeError, OSError):
+        pass
+
+
+def _preallocate(f: BinaryIO, size: int) -> bool:
+    """
+    Dosya için size byte'lık alanı tek seferde ayırır (posix_fallocate).
+    Desteklenmiyorsa veya dosya sistemi reddederse False döner.
+    """
+    if not hasattr(os, "posix_fallocate"):
+        return False
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+        return True
+    except OSError:
+        return False
+
+
+def _plausible_size(info: zipfile.ZipInfo, dest_dir: Path) -> bool:
+    """
+    Merkezi dizindeki file_size değerinin makul olup olmadığını kontrol eder.
+    Bozuk arşivlerde bu değer yanlış olabilir; ön-ayırma için sıkıştırma oranı ve
+    diskteki boş alanla tutarlı olmalıdır.
+    """
+    if info.compress_type == zipfile.ZIP_STORED:
+        max_size = info.compress_size
+    else:
+        max_size = info.compress_size * MAX_DEFLATE_RATIO
+    if info.file_size > max_size:
+        return False
+    try:
+        return info.file_size <= shutil.disk_usage(dest_dir).free
+    except OSError:
+        return False
+
+
+def _read_at(f: BinaryIO, offset: int, length: int) -> bytes:
+    """
+    Dosyadan verilen offset'ten length byte okur (POSIX'te tek pread çağrısı).
+    Dönen bytes üzerinde rfind, stdlib'in hızlı arama (fastsearch) yolunu kullanır.
+    """
+    if hasattr(os, "pread"):
+        return os.pread(f.fileno(), length, offset)
+    f.seek(offset)
+    return f.read(length)
+
+
+class _CountingWriter:
+    """
+    copyfileobj ile yazılan byte sayısını (tell() desteklemeyen hedefler için) ve
+    yazılan verinin CRC-32'sini izler.
+    """
+
+    def __init__(self, dst: BinaryIO) -> None:
+        self.dst = dst
+        self.written = 0
+        self.crc = 0
+
+    def write(self, data: bytes) -> int:
+        n = self.dst.write(data)
+        self.written += n
+        self.crc = zlib.crc32(data, self.crc)
+        return n
+
+
+def _disable_crc_check(src: BinaryIO) -> None:
+    """
+    ZipExtFile'ın kendi CRC kontrolünü kapatır; CRC'yi _CountingWriter ile çağıran doğrular.
+    zipfile CRC'yi son okumada doğrular ve tutmazsa o okumanın verisini (bir tampon dolusu)
+    atar; geri almak için girişin baştan yeniden inflate edilmesi gerekirdi.
+    """
+    src._expected_crc = None  # type: ignore[attr-defined]
+
+
+def _salvage_copy(src: BinaryIO, dst: BinaryIO, offset: int) -> None:
+    """
+    Büyük tamponlu kopyalama hata verdikten sonra, hedefe yazılmış son noktadan (offset)
+    itibaren küçük chunk'larla yeniden okuyup hata noktasına kadar olan veriyi kurtarır.
+    Geriye seek girişi baştan inflate ettirir; bu yüzden yalnızca akış ortasındaki
+    bozulmalarda (zlib.error, erken biten akış) çağrılır, CRC hatasında değil.
+    """
+    try:
+        src.seek(offset)
+        while True:
+            chunk = src.read(SALVAGE_CHUNK_SIZE)
+            if not chunk:
+                break
+            dst.write(chunk)
+    except Exception:
+        # Hata noktasına ulaşıldı, kurtarılabilen kadarı yazıldı
+        pass
+
+
+def _find_zip64_locator(tail: bytes) -> int:
+    """
+    Dosya sonundaki tail içinde ZIP64 locator'ın konumunu döndürür (yoksa -1).
+    Locator EOCD kaydının hemen önünde durduğu için önce EOCD bulunur ve locator
+    20 byte gerisinde doğrudan yoklanır; tutmazsa tail'de locator imzası aranır.
+    """
+    eocd_pos = tail.rfind(_ZIP_EOCD_SIG_BYTES)
+    candidate = eocd_pos - _LOCATOR.size
+    if eocd_pos != -1 and candidate >= 0 and tail.startswith(_ZIP64_LOCATOR_SIG_BYTES, candidate):
+        return candidate
+    return tail.rfind(_ZIP64_LOCATOR_SIG_BYTES)
+
+
+def _iter_files(base: str) -> Iterator[str]:
+    """
+    os.scandir tabanlı özyinelemeli dosya taraması (os.walk + Path yerine).
+    DirEntry.is_file/is_dir dizin okumasından önbelleklendiği için ekstra stat yapılmaz.
+    os.walk(followlinks=False) ile aynı: klasör symlink'lerine inilmez, dosya symlink'leri listelenir;
+    okunamayan (izinsiz/silinmiş) klasörler atlanır.
+    """
+    stack = [base]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError as e:
+            log(f"[REBUILD][WARN] Klasör okunamadı, atlanıyor: {current} ({e})")
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+
+def _deflate_file(job: Tuple[str, str]) -> Tuple[zipfile.ZipInfo, bytes]:
+    """
+    Process pool işçisi: dosyayı okuyup ham DEFLATE (wbits=-15) ile sıkıştırır.
+    CRC ve boyutlar burada hesaplanır, ana süreç veriyi tekrar sıkıştırmadan yazar.
+    """
+    full_path, arcname = job
+    zinfo = zipfile.ZipInfo.from_file(full_path, arcname)
+
+    with open(full_path, "rb") as f:
+        data = f.read()
+
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS)
+    blob = compressor.compress(data) + compressor.flush()
+
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(blob)
+    zinfo.CRC = zlib.crc32(data)
+    return zinfo, blob
+
+
+def _copy_exact(src: BinaryIO, dst: BinaryIO, length: int) -> None:
+    """src'den tam olarak length byte'ı dst'ye kopyalar; veri eksikse hata verir."""
+    remaining = length
+    while remaining > 0:
+        chunk = src.read(min(remaining, EXTRACT_BUFFER_SIZE))
+        if not chunk:
+            raise EOFError(f"Beklenen {length} byte yerine {length - remaining} byte okunabildi")
+        dst.write(chunk)
+        remaining -= len(chunk)
+
+
+def _crc_file(job: Tuple[str, str]) -> Tuple[zipfile.ZipInfo, bytes]:
+    """
+    Thread pool işçisi: küçük bir dosyayı bir kez okuyup CRC-32'sini hesaplar
+    (zlib.crc32 GIL'i bırakır). Veri, ZIP_STORED girişi olarak olduğu gibi yazılır.
+    """
+    full_path, arcname = job
+    zinfo = zipfile.ZipInfo.from_file(full_path, arcname)
+
+    with open(full_path, "rb") as f:
+        data = f.read()
+
+    zinfo.compress_type = zipfile.ZIP_STORED
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(data)
+    zinfo.CRC = zlib.crc32(data)
+    return zinfo, data
+
+
+def _seek_member_data(f: BinaryIO, info: zipfile.ZipInfo) -> None:
+    """
+    Kaynak ZIP dosyasını, girişin sıkıştırılmış verisinin başına konumlar:
+    local file header (30 byte) + dosya adı + extra alanı atlanır.
+    """
+    f.seek(info.header_offset)
+    fields = _LOCAL_HEADER.unpack(f.read(_LOCAL_HEADER.size))
+    if fields[0] != ZIP_LOCAL_HEADER_SIG:
+        raise zipfile.BadZipFile("Local header signature tutmuyor")
+    f.seek(fields[9] + fields[10], os.SEEK_CUR)
+
+
+def _copy_attrs(zinfo: zipfile.ZipInfo, info: zipfile.ZipInfo) -> None:
+    """
+    Kaynak girişin dosya özniteliklerini yeni ZipInfo'ya aktarır.
+    external_attr, create_system olmadan anlamsızdır: Windows arşivlerinde (create_system=0)
+    DOS öznitelikleri tutulur ve Unix mod bitleri 0'dır; bunlar Unix girişi sayılırsa
+    çıkarılan dosyalar izinsiz (----------) açılır. Mod bitleri boş Unix girişlerinde
+    zipfile'ın writestr varsayılanı (0o600) kullanılır.
+    """
+    zinfo.create_system = info.create_system
+    zinfo.external_attr = info.external_attr
+    if zinfo.create_system == 3 and not zinfo.external_attr >> 16:
+        zinfo.external_attr |= 0o600 << 16
+
+
+def _write_raw_member(z: zipfile.ZipFile,
+                      zinfo: zipfile.ZipInfo,
+                      data: Union[bytes, BinaryIO]) -> None:
+    """
+    CRC/boyutları hazır, önceden sıkıştırılmış bir girişi arşive olduğu gibi ekler.
+    data bytes ise doğrudan yazılır, dosya nesnesi ise zinfo.compress_size kadar kopyalanır.
+    Stdlib'deki ZipFile.mkdir / _ZipWriteFile.close akışını taklit eder.
+
+    CRC ve boyutlar önceden bilindiği için local header eksiksiz yazılır; çıktı seekable
+    olmasa bile data descriptor (bit 3) ve sonradan header'a geri dönme gerekmez.
+    """
+    zinfo.flag_bits &= ~ZIP_FLAG_DATA_DESCRIPTOR
+
+    with z._lock:
+        if z._seekable:
+            z.fp.seek(z.start_dir)
+        zinfo.header_offset = z.fp.tell()
+
+        z._writecheck(zinfo)
+        z._didModify = True
+
+        z.fp.write(zinfo.FileHeader())
+        if isinstance(data, bytes):
+            z.fp.write(data)
+        else:
+            _copy_exact(data, z.fp, zinfo.compress_size)
+        z.start_dir = z.fp.tell()
+
+        z.filelist.append(zinfo)
+        z.NameToInfo[zinfo.filename] = zinfo
 
 
 # ==========================
@@ -65,10 +427,14 @@ def log(msg: str) -> None:
 # ==========================
 
 class ZipAnalyzer:
-    """ZIP dosyasını analiz eder, entry’leri listeler, temel yapısal kontrolleri yapar."""
+    """
+    ZIP dosyasını analiz eder, entry’leri listeler, temel yapısal kontrolleri yapar.
+    Dosya yolu veya önceden açılmış bir ZipFile ile çalışabilir.
+    """
 
-    def __init__(self, zip_path: Path) -> None:
-        self.zip_path = zip_path
+    def __init__(self, source: Union[Path, zipfile.ZipFile]) -> None:
+        self.source = source
+        self.zip_path = _source_path(source)
 
     def analyze(self) -> bool:
         log(f"[CHECK] {self.zip_path} inceleniyor...")
@@ -78,7 +444,7 @@ class ZipAnalyzer:
             return False
 
         try:
-            with zipfile.ZipFile(self.zip_path, "r", allowZip64=True) as z:
+            with _open_zip(self.source) as z:
                 infolist = z.infolist()
                 log(f"[CHECK] Toplam {len(infolist)} giriş bulundu.")
                 for info in infolist:
@@ -90,7 +456,7 @@ class ZipAnalyzer:
                     else:
                         comp_type = str(info.compress_type)
 
-                    log(
+                    log_entry(
                         f"  - {info.filename} | {human_size(info.file_size)} "
                         f"(comp: {human_size(info.compress_size)}, "
                         f"type={comp_type}, flags=0x{flag:04x})"
@@ -136,63 +502,61 @@ class Zip64Fixer:
                 log("[ZIP64] Dosya çok küçük, ZIP64 beklenmez.")
                 return False
 
-            f.seek(0)
-            mm = mmap.mmap(f.fileno(), 0)
-
-            try:
-                sig_bytes = struct.pack("<I", ZIP64_EOCD_LOCATOR_SIG)
-                pos = mm.rfind(sig_bytes)
-                if pos == -1:
-                    log("[ZIP64] ZIP64 locator (0x07064b50) bulunamadı.")
-                    return False
+            # Locator, spec gereği dosyanın son ~64KB'ı (+ yorum) içinde olur;
+            # tüm dosyayı taramak yerine yalnızca kuyruğu oku.
+            tail_len = min(size, ZIP64_LOCATOR_SEARCH_SIZE)
+            tail = _read_at(f, size - tail_len, tail_len)
 
-                log(f"[ZIP64] Locator bulundu: offset {pos}")
+            pos_in_tail = _find_zip64_locator(tail)
+            if pos_in_tail == -1:
+                log("[ZIP64] ZIP64 locator (0x07064b50) bulunamadı.")
+                return False
 
-                # ZIP64 End of Central Directory Locator:
-                # signature   (4 byte)
-                # disk_no     (4 byte)
-                # eocd_offset (8 byte)
-                # total_disks (4 byte)
-                if pos + 20 > size:
-                    log("[ZIP64] Locator tam değil (dosya sonuna taşıyor).")
-                    return False
+            pos = size - tail_len + pos_in_tail
+            log(f"[ZIP64] Locator bulundu: offset {pos}")
 
-                raw = mm[pos:pos + 20]
-                sig, disk_no, eocd_offset, total_disks = struct.unpack("<IIQI", raw)
+            # ZIP64 End of Central Directory Locator:
+            # signature   (4 byte)
+            # disk_no     (4 byte)
+            # eocd_offset (8 byte)
+            # total_disks (4 byte)
+            if pos + 20 > size:
+                log("[ZIP64] Locator tam değil (dosya sonuna taşıyor).")
+                return False
 
-                if sig != ZIP64_EOCD_LOCATOR_SIG:
-                    log("[ZIP64] Locator signature tutmuyor, işlem iptal.")
-                    return False
+            sig, disk_no, eocd_offset, total_disks = _LOCATOR.unpack_from(tail, pos_in_tail)
 
-                log(
-                    f"[ZIP64] Mevcut değerler -> "
-                    f"disk_no={disk_no}, eocd_offset={eocd_offset}, total_disks={total_disks}"
-                )
+            if sig != ZIP64_EOCD_LOCATOR_SIG:
+                log("[ZIP64] Locator signature tutmuyor, işlem iptal.")
+                return False
 
-                if total_disks == 1:
-                    log("[ZIP64] 'total_disks' zaten 1, düzeltme gerekmiyor.")
-                    return False
+            log(
+                f"[ZIP64] Mevcut değerler -> "
+                f"disk_no={disk_no}, eocd_offset={eocd_offset}, total_disks={total_disks}"
+            )
 
-                if total_disks != 0:
-                    log(
-                        f"[ZIP64] 'total_disks' beklenmeyen bir değer: {total_disks}. "
-                        f"OneDrive bug’ı olmayabilir."
-                    )
-                    return False
+            if total_disks == 1:
+                log("[ZIP64] 'total_disks' zaten 1, düzeltme gerekmiyor.")
+                return False
 
-                log("[ZIP64] OneDrive tarzı bug tespit edildi: total_disks=0. 1 yapacağız.")
+            if total_disks != 0:
+                log(
+                    f"[ZIP64] 'total_disks' beklenmeyen bir değer: {total_disks}. "
+                    f"OneDrive bug’ı olmayabilir."
+                )
+                return False
 
-                if not dry_run:
-                    mm[pos + 16:pos + 20] = struct.pack("<I", 1)
-                    mm.flush()
-                    log("[ZIP64] total_disks alanı 1 olarak PATCH edildi.")
-                else:
-                    log("[ZIP64] --dry-run aktif, değişiklik yapılmadı.")
+            log("[ZIP64] OneDrive tarzı bug tespit edildi: total_disks=0. 1 yapacağız.")
 
-                return not dry_run
+            if not dry_run:
+                f.seek(pos + 16)
+                f.write(_U32LE.pack(1))
+                f.flush()
+                log("[ZIP64] total_disks alanı 1 olarak PATCH edildi.")
+            else:
+                log("[ZIP64] --dry-run aktif, değişiklik yapılmadı.")
 
-            finally:
-                mm.close()
+            return not dry_run
 
 
 # ==========================
@@ -203,57 +567,66 @@ class ZipExtractor:
     """
     CRC ve bazı okuma hatalarını görmezden gelerek, mümkün olduğunca fazla dosya çıkarır.
     Büyük dosyalar için bile streaming okuma (chunk’lı).
+    Dosya yolu veya önceden açılmış bir ZipFile ile çalışabilir.
     """
 
-    def __init__(self, zip_path: Path, out_dir: Path) -> None:
-        self.zip_path = zip_path
+    def __init__(self,
+                 source: Union[Path, zipfile.ZipFile],
+                 out_dir: Path,
+                 verbose: bool = False,
+                 jobs: Optional[int] = None) -> None:
+        self.source = source
+        self.zip_path = _source_path(source)
         self.out_dir = out_dir
+        self.verbose = verbose
+        self.jobs = jobs or os.cpu_count() or 1
+        # Hatasız (CRC doğrulanmış) çıkarılan girişler: arcname -> ZipInfo
+        self.clean_entries: Dict[str, zipfile.ZipInfo] = {}
+        self._zip_lock = threading.Lock()
+        # Oluşturulduğu bilinen klasörler (giriş başına mkdir/stat yapmamak için)
+        self._created_dirs: Set[Path] = set()
 
     def extract_best_effort(self) -> bool:
         log(f"[EXTRACT] {self.zip_path} -> {self.out_dir}")
 
-        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.out_dir)
         success_any = False
 
         try:
-            with zipfile.ZipFile(self.zip_path, "r", allowZip64=True) as z:
+            with _open_zip(self.source) as z:
+                # Arşiv baştan sona okunacak: readahead'i artır
+                _fadvise(z.fp, "POSIX_FADV_SEQUENTIAL")
+
                 infolist = z.infolist()
                 if not infolist:
                     log("[EXTRACT] Arşivde hiç giriş yok.")
                     return False
 
+                # Aynı hedef dosyaya iki thread'in birden yazmaması için girişler çözümlenmiş
+                # hedef yola göre tekilleştirilir ("./a.txt" / "a.txt", "a//b" / "a/b",
+                # büyük/küçük harf duyarsız dosya sistemlerinde "A.txt" / "a.txt");
+                # zipfile.NameToInfo'daki gibi sonuncusu geçerli.
+                file_infos: Dict[str, zipfile.ZipInfo] = {}
                 for info in infolist:
                     name = info.filename
 
                     # Klasör ise sadece oluştur
                     if name.endswith("/"):
-                        (self.out_dir / name).mkdir(parents=True, exist_ok=True)
+                        self._ensure_dir(self.out_dir / name)
                         continue
 
+                    # Üst klasörler worker'lara dağıtmadan önce burada hazırlanır
                     dest_path = self.out_dir / name
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    log(f"[EXTRACT] → {name}")
+                    self._ensure_dir(dest_path.parent)
+                    key = str(dest_path)
+                    if CASE_INSENSITIVE_FS:
+                        key = key.casefold()
+                    file_infos[key] = info
 
-                    try:
-                        with z.open(info, "r") as src, dest_path.open("wb") as dst:
-                            while True:
-                                try:
-                                    chunk = src.read(1024 * 1024)  # 1MB
-                                except Exception as read_err:
-                                    # Genelde CRC veya stream sonu ile ilgili hata
-                                    log(f"[EXTRACT][WARN] Okuma hatası (CRC vb.): {read_err}")
-                                    break
-
-                                if not chunk:
-                                    break
-                                dst.write(chunk)
-
-                        success_any = True
-
-                    except Exception as e:
-                        log(f"[EXTRACT][ERROR] {name} çıkarılamadı: {e}")
-                        traceback.print_exc()
+                # Inflate (zlib) GIL'i bıraktığı için girişler thread'lerde paralel açılır
+                with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                    results = list(executor.map(lambda info: self._extract_one(z, info), file_infos.values()))
+                success_any = any(results)
 
             if success_any:
                 log("[EXTRACT] En az bir dosya başarıyla çıkarıldı (CRC hataları görmezden gelinmiş olabilir).")
@@ -267,6 +640,74 @@ class ZipExtractor:
             traceback.print_exc()
             return False
 
+    def _ensure_dir(self, d: Path) -> None:
+        """Klasörü üst klasörleriyle oluşturur; daha önce oluşturulmuşsa hiçbir şey yapmaz."""
+        if d in self._created_dirs:
+            return
+        d.mkdir(parents=True, exist_ok=True)
+
+        p = d
+        while p not in self._created_dirs and p != self.out_dir.parent:
+            self._created_dirs.add(p)
+            p = p.parent
+
+    def _extract_one(self, z: zipfile.ZipFile, info: zipfile.ZipInfo) -> bool:
+        """Tek bir girişi best-effort çıkarır (worker thread içinde çalışır)."""
+        name = info.filename
+        dest_path = self.out_dir / name
+
+        log_entry(f"[EXTRACT] → {name}")
+
+        try:
+            clean = True
+            # ZipFile.open/close paylaşılan dosya referans sayacını kilitsiz günceller;
+            # okumaların kendisi zipfile'ın iç kilidiyle zaten thread-safe.
+            with self._zip_lock:
+                src = z.open(info, "r")
+            _disable_crc_check(src)
+            try:
+                with dest_path.open("wb") as dst:
+                    out = _CountingWriter(dst)
+                    # Büyük dosyalarda tek seferlik, bitişik alan ayırımı
+                    preallocated = (info.file_size > PREALLOCATE_MIN_SIZE
+                                    and _plausible_size(info, dest_path.parent)
+                                    and _preallocate(dst, info.file_size))
+                    try:
+                        # Hızlı yol: C seviyesinde büyük tamponlu kopyalama
+                        shutil.copyfileobj(src, out, EXTRACT_BUFFER_SIZE)
+                    except Exception as read_err:
+                        # Bozuk deflate akışı veya erken biten stream
+                        log(f"[EXTRACT][WARN] Okuma hatası: {read_err}")
+                        _salvage_copy(src, out, out.written)
+                        clean = False
+
+                    if clean and out.crc != info.CRC:
+                        # Akış sonuna kadar okundu, sadece CRC tutmuyor
+                        log(f"[EXTRACT][WARN] {name}: CRC uyuşmuyor (veri sonuna kadar çıkarıldı)")
+                        clean = False
+
+                    # Veri eksik kaldıysa önceden ayrılan fazla alanı bırak
+                    if preallocated:
+                        dst.truncate()
+
+                    # Çıkarılan veri tekrar okunmayacak: page cache'i doldurmasın
+                    dst.flush()
+                    _fadvise(dst, "POSIX_FADV_DONTNEED")
+            finally:
+                with self._zip_lock:
+                    src.close()
+
+            if clean:
+                self.clean_entries[name] = info
+            return True
+
+        except Exception as e:
+            log(f"[EXTRACT][ERROR] {name} çıkarılamadı: {type(e).__name__}: {e}")
+            # Bozuk arşivlerde her girişte traceback basmak çok yavaş; sadece --verbose ile
+            if self.verbose:
+                traceback.print_exc()
+            return False
+
 
 # ==========================
 #  ZIP Rebuilder
@@ -275,12 +716,24 @@ class ZipExtractor:
 class ZipRebuilder:
     """
     Bir klasör altındaki tüm dosyalardan yeni, temiz bir ZIP oluşturur.
+
+    raw_source + raw_entries verilirse (AUTO pipeline), kaynak ZIP'ten hatasız çıkarılmış
+    girişlerin sıkıştırılmış verisi yeniden sıkıştırılmadan doğrudan kopyalanır.
     """
 
-    def __init__(self, src_dir: Path, out_zip: Path, compression: int = zipfile.ZIP_DEFLATED) -> None:
+    def __init__(self,
+                 src_dir: Path,
+                 out_zip: Path,
+                 compression: int = zipfile.ZIP_DEFLATED,
+                 raw_source: Optional[Path] = None,
+                 raw_entries: Optional[Dict[str, zipfile.ZipInfo]] = None,
+                 jobs: Optional[int] = None) -> None:
         self.src_dir = src_dir
         self.out_zip = out_zip
         self.compression = compression
+        self.raw_source = raw_source
+        self.raw_entries = raw_entries or {}
+        self.jobs = jobs or os.cpu_count() or 1
 
     def rebuild(self) -> bool:
         log(f"[REBUILD] {self.src_dir} içinden yeni ZIP oluşturuluyor -> {self.out_zip}")
@@ -292,18 +745,293 @@ class ZipRebuilder:
         self.out_zip.parent.mkdir(parents=True, exist_ok=True)
 
         file_count = 0
+        deflate_jobs: List[Tuple[str, str]] = []
+        stored_jobs: List[Tuple[str, str]] = []
+        raw_jobs: List[Tuple[str, str, zipfile.ZipInfo]] = []
+        raw_entries = self.raw_entries if self.raw_source is not None else {}
+        # arcname = tam yolun kaynak klasör önekinden sonraki kısmı
+        base = str(self.src_dir)
+        prefix_len = len(os.path.join(base, ""))
+
         with zipfile.ZipFile(self.out_zip, "w", compression=self.compression, allowZip64=True) as z:
-            for root, dirs, files in os.walk(self.src_dir):
-                for fname in files:
-                    full_path = Path(root) / fname
-                    rel_path = full_path.relative_to(self.src_dir)
-                    z.write(full_path, arcname=str(rel_path))
-                    file_count += 1
-                    log(f"[REBUILD] + {rel_path}")
+            for full_path in _iter_files(base):
+                arcname = full_path[prefix_len:].replace(os.sep, "/")
+                size = os.path.getsize(full_path)
+
+                # Kaynak ZIP'ten temiz çıkarılmış girişler ham olarak kopyalanacak
+                src_info = raw_entries.get(arcname)
+                if (src_info is not None
+                        and src_info.compress_type == self.compression
+                        and src_info.file_size == size):
+                    raw_jobs.append((full_path, arcname, src_info))
+                    continue
+
+                # STORED girişler (ve sıkıştırılamaz dosyalar): küçükler thread pool'da
+                # paralel CRC ile, büyükler tek geçişte z.write ile yazılır
+                if (self.compression == zipfile.ZIP_STORED
+                        or os.path.splitext(full_path)[1].lower() in STORED_EXTENSIONS):
+                    if size <= PARALLEL_DEFLATE_MAX_SIZE:
+                        stored_jobs.append((full_path, arcname))
+                    else:
+                        z.write(full_path, arcname=arcname, compress_type=zipfile.ZIP_STORED)
+                        file_count += 1
+                        log_entry(f"[REBUILD] + {arcname}")
+                    continue
+
+                # Küçük dosyalar process pool'da paralel sıkıştırılacak
+                if self.compression == zipfile.ZIP_DEFLATED and size <= PARALLEL_DEFLATE_MAX_SIZE:
+                    deflate_jobs.append((full_path, arcname))
+                    continue
+
+                z.write(full_path, arcname=arcname)
+                file_count += 1
+                log_entry(f"[REBUILD] + {arcname}")
+
+            if raw_jobs:
+                file_count += self._copy_raw_entries(z, raw_jobs)
+
+            if stored_jobs:
+                file_count += self._write_stored_entries(z, stored_jobs)
+
+            if deflate_jobs:
+                file_count += self._write_deflated_entries(z, deflate_jobs)
 
         log(f"[REBUILD] Tamamlandı. Yeni ZIP: {self.out_zip} (toplam {file_count} dosya)")
         return file_count > 0
 
+    def _write_deflated_entries(self,
+                                z: zipfile.ZipFile,
+                                deflate_jobs: List[Tuple[str, str]]) -> int:
+        """
+        Küçük dosyaları process pool'da paralel sıkıştırıp sırayla arşive ekler.
+        Bellek sınırlı kalsın diye aynı anda en fazla işçi sayısı × PARALLEL_DEFLATE_IN_FLIGHT
+        iş bekletilir; sonuçlar yazıldıkça yenileri gönderilir.
+        """
+        count = 0
+        workers = self.jobs
+        if sys.platform == "win32":
+            workers = min(workers, WINDOWS_MAX_PROCESS_WORKERS)
+        max_in_flight = workers * PARALLEL_DEFLATE_IN_FLIGHT
+        pending: Deque[Future] = deque()
+
+        def write_next() -> None:
+            zinfo, blob = pending.popleft().result()
+            _write_raw_member(z, zinfo, blob)
+            log_entry(f"[REBUILD] + {zinfo.filename}")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for job in deflate_jobs:
+                pending.append(executor.submit(_deflate_file, job))
+                if len(pending) >= max_in_flight:
+                    write_next()
+                    count += 1
+
+            while pending:
+                write_next()
+                count += 1
+
+        return count
+
+    def _write_stored_entries(self,
+                              z: zipfile.ZipFile,
+                              stored_jobs: List[Tuple[str, str]]) -> int:
+        """
+        Küçük ZIP_STORED dosyaları thread pool'da okuyup CRC'lerini paralel hesaplar,
+        ardından veriyi tekrar okumadan arşive ekler. Büyük dosyalar buraya gelmez,
+        tek geçişte z.write ile yazılır. Deflate havuzundaki gibi bekleyen iş sayısı sınırlıdır.
+        """
+        count = 0
+        max_in_flight = self.jobs * PARALLEL_DEFLATE_IN_FLIGHT
+        pending: Deque[Future] = deque()
+
+        def write_next() -> None:
+            zinfo, data = pending.popleft().result()
+            _write_raw_member(z, zinfo, data)
+            log_entry(f"[REBUILD] + {zinfo.filename}")
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            for job in stored_jobs:
+                pending.append(executor.submit(_crc_file, job))
+                if len(pending) >= max_in_flight:
+                    write_next()
+                    count += 1
+
+            while pending:
+                write_next()
+                count += 1
+
+        return count
+
+    def _copy_raw_entries(self,
+                          z: zipfile.ZipFile,
+                          raw_jobs: List[Tuple[str, str, zipfile.ZipInfo]]) -> int:
+        """
+        Kaynak ZIP'teki sıkıştırılmış veriyi CRC/boyutlarıyla birlikte yeni arşive aktarır.
+        Ham kopyası alınamayan girişler normal yoldan yeniden sıkıştırılır.
+        """
+        count = 0
+        # Kaynak arşivi sıralı okumak için local header sırasına göre ilerle
+        raw_jobs.sort(key=lambda job: job[2].header_offset)
+
+        with self.raw_source.open("rb") as src:
+            for full_path, arcname, src_info in raw_jobs:
+                try:
+                    _seek_member_data(src, src_info)
+
+                    zinfo = zipfile.ZipInfo.from_file(full_path, arcname)
+                    zinfo.compress_type = src_info.compress_type
+                    zinfo.CRC = src_info.CRC
+                    zinfo.file_size = src_info.file_size
+                    zinfo.compress_size = src_info.compress_size
+
+                    _write_raw_member(z, zinfo, src)
+                    log_entry(f"[REBUILD] = {arcname} (ham kopya)")
+
+                except Exception as e:
+                    log(f"[REBUILD][WARN] {arcname} ham kopyalanamadı, yeniden sıkıştırılıyor: {e}")
+                    z.write(full_path, arcname=arcname)
+                    log_entry(f"[REBUILD] + {arcname}")
+
+                count += 1
+
+        return count
+
+
+# ==========================
+#  Fused Extract + Rebuild
+# ==========================
+
+class ZipStreamRepacker:
+    """
+    Extract ve rebuild adımlarını tek geçişte birleştirir: hiçbir giriş diske çıkarılmaz.
+
+    Önce tüm girişler thread pool'da inflate edilerek CRC'leri doğrulanır. CRC'si tutan
+    girişlerin sıkıştırılmış verisi yeniden sıkıştırılmadan doğrudan kopyalanır; yalnızca
+    bozuk veya farklı yöntemle sıkıştırılmış girişler yeniden sıkıştırılır.
+    CRC/okuma hatalarında, extract'taki gibi kurtarılabilen kısım yazılır.
+    """
+
+    def __init__(self,
+                 source: Union[Path, zipfile.ZipFile],
+                 out_zip: Path,
+                 compression: int = zipfile.ZIP_DEFLATED,
+                 verbose: bool = False,
+                 jobs: Optional[int] = None) -> None:
+        self.source = source
+        self.zip_path = _source_path(source)
+        self.out_zip = out_zip
+        self.compression = compression
+        self.verbose = verbose
+        self.jobs = jobs or os.cpu_count() or 1
+        self._zip_lock = threading.Lock()
+
+    def repack(self) -> bool:
+        log(f"[FUSE] {self.zip_path} -> {self.out_zip} (diske çıkarmadan tek geçiş)")
+
+        self.out_zip.parent.mkdir(parents=True, exist_ok=True)
+        file_count = 0
+
+        try:
+            with _open_zip(self.source) as zin, \
+                    self.zip_path.open("rb") as raw_src, \
+                    zipfile.ZipFile(self.out_zip, "w", compression=self.compression, allowZip64=True) as zout:
+                _fadvise(zin.fp, "POSIX_FADV_SEQUENTIAL")
+
+                # Rebuild ile aynı: klasör girişleri yeni ZIP'e yazılmaz
+                infos = [info for info in zin.infolist() if not info.filename.endswith("/")]
+
+                # Ham kopyaya uygun girişler paralel inflate ile doğrulanır
+                with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                    verified = list(executor.map(lambda info: self._verify(zin, info), infos))
+
+                for info, ok in zip(infos, verified):
+                    name = info.filename
+                    if ok and self._copy_raw(zout, raw_src, info):
+                        log_entry(f"[FUSE] = {name} (ham kopya)")
+                        file_count += 1
+                        continue
+
+                    log_entry(f"[FUSE] → {name}")
+                    if self._recompress(zin, zout, info):
+                        file_count += 1
+
+        except Exception as e:
+            log(f"[FUSE] ZipFile açılırken hata: {e}")
+            traceback.print_exc()
+            return False
+
+        log(f"[FUSE] Tamamlandı. Yeni ZIP: {self.out_zip} (toplam {file_count} dosya)")
+        return file_count > 0
+
+    def _verify(self, zin: zipfile.ZipFile, info: zipfile.ZipInfo) -> bool:
+        """
+        Girişi sonuna kadar inflate edip CRC'sini doğrular (worker thread içinde çalışır).
+        Hedefle aynı yöntemle sıkıştırılmamış girişler ham kopyaya uygun değildir.
+        """
+        if info.compress_type != self.compression:
+            return False
+        try:
+            # ZipFile.open/close paylaşılan referans sayacını kilitsiz günceller
+            with self._zip_lock:
+                src = zin.open(info, "r")
+            try:
+                while src.read(EXTRACT_BUFFER_SIZE):
+                    pass
+            finally:
+                with self._zip_lock:
+                    src.close()
+            return True
+        except Exception:
+            return False
+
+    def _copy_raw(self, zout: zipfile.ZipFile, raw_src: BinaryIO, info: zipfile.ZipInfo) -> bool:
+        """Doğrulanmış girişin sıkıştırılmış verisini CRC/boyutlarıyla olduğu gibi kopyalar."""
+        try:
+            _seek_member_data(raw_src, info)
+
+            zinfo = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+            _copy_attrs(zinfo, info)
+            zinfo.compress_type = info.compress_type
+            zinfo.CRC = info.CRC
+            zinfo.file_size = info.file_size
+            zinfo.compress_size = info.compress_size
+
+            _write_raw_member(zout, zinfo, raw_src)
+            return True
+        except Exception as e:
+            log(f"[FUSE][WARN] {info.filename} ham kopyalanamadı, yeniden sıkıştırılıyor: {e}")
+            return False
+
+    def _recompress(self, zin: zipfile.ZipFile, zout: zipfile.ZipFile, info: zipfile.ZipInfo) -> bool:
+        """Girişi inflate edip yeniden sıkıştırarak yazar; okuma hatasında kurtarılanı yazar."""
+        name = info.filename
+        try:
+            zinfo = zipfile.ZipInfo(name, date_time=info.date_time)
+            _copy_attrs(zinfo, info)
+            zinfo.compress_type = self.compression
+            # zipfile ZIP64 gerekip gerekmediğine bu boyuta bakarak karar verir
+            zinfo.file_size = info.file_size
+
+            with zin.open(info, "r") as src, zout.open(zinfo, "w") as dst:
+                _disable_crc_check(src)
+                counter = _CountingWriter(dst)
+                try:
+                    shutil.copyfileobj(src, counter, EXTRACT_BUFFER_SIZE)
+                except Exception as read_err:
+                    # Bozuk deflate akışı veya erken biten stream
+                    log(f"[FUSE][WARN] {name} okuma hatası: {read_err}")
+                    _salvage_copy(src, counter, counter.written)
+                else:
+                    if counter.crc != info.CRC:
+                        log(f"[FUSE][WARN] {name}: CRC uyuşmuyor (veri sonuna kadar aktarıldı)")
+            return True
+
+        except Exception as e:
+            log(f"[FUSE][ERROR] {name} aktarılamadı: {type(e).__name__}: {e}")
+            if self.verbose:
+                traceback.print_exc()
+            return False
+
 
 # ==========================
 #  AUTO Pipeline
@@ -311,13 +1039,18 @@ class ZipRebuilder:
 
 def auto_repair_pipeline(zip_path: Path,
                          work_dir: Optional[Path] = None,
-                         fixed_zip_path: Optional[Path] = None) -> None:
+                         fixed_zip_path: Optional[Path] = None,
+                         verbose: bool = False,
+                         fuse: bool = False,
+                         jobs: Optional[int] = None) -> None:
     """
     AUTO mod:
-      1) check
-      2) ZIP64 locator fix (varsa)
+      1) ZIP64 locator fix (varsa)
+      2) check
       3) best-effort extract
       4) rebuild new zip
+
+    fuse=True ise 3) ve 4) diske çıkarmadan tek geçişte yapılır.
     """
     log("========== ZIP DOCTOR AUTO MODE ==========")
     log(f"[AUTO] Kaynak ZIP: {zip_path}")
@@ -331,13 +1064,8 @@ def auto_repair_pipeline(zip_path: Path,
 
     work_dir.mkdir(parents=True, exist_ok=True)
 
-    # 1) check
-    log("\n[AUTO] Adım 1: Yapı kontrolü (check)")
-    analyzer = ZipAnalyzer(zip_path)
-    analyzer.analyze()
-
-    # 2) ZIP64 fix denemesi
-    log("\n[AUTO] Adım 2: ZIP64 locator fix (OneDrive bug tespiti)")
+    # 1) ZIP64 fix denemesi (sonraki adımlar düzeltilmiş arşivi okusun)
+    log("\n[AUTO] Adım 1: ZIP64 locator fix (OneDrive bug tespiti)")
     try:
         fixer = Zip64Fixer(zip_path)
         changed = fixer.fix_total_disks(dry_run=False)
@@ -349,17 +1077,48 @@ def auto_repair_pipeline(zip_path: Path,
         log(f"[AUTO] ZIP64 fix sırasında hata: {e}")
         traceback.print_exc()
 
-    # 3) CRC’yi görmezden gelerek extract
-    log("\n[AUTO] Adım 3: CRC hatalarını görmezden gelerek çıkarma (best-effort)")
-    extractor = ZipExtractor(zip_path, extract_dir)
-    success_extract = extractor.extract_best_effort()
-    if not success_extract:
-        log("[AUTO] Uyarı: Extract işlemi başarısız veya eksik oldu.")
-
-    # 4) Yeni ZIP oluşturma
-    log("\n[AUTO] Adım 4: Çıkarılan dosyalardan yeni ZIP oluşturma (rebuild)")
-    rebuilder = ZipRebuilder(extract_dir, fixed_zip_path)
-    success_rebuild = rebuilder.rebuild()
+    # Merkezi dizin check ve extract için tek sefer okunur.
+    # Açılamazsa adımlar dosya yolu ile devam eder ve hatayı kendileri raporlar.
+    source: Union[Path, zipfile.ZipFile] = zip_path
+    try:
+        source = zipfile.ZipFile(zip_path, "r", allowZip64=True)
+    except Exception as e:
+        log(f"[AUTO] ZipFile açılamadı: {e}")
+
+    try:
+        # 2) check
+        log("\n[AUTO] Adım 2: Yapı kontrolü (check)")
+        analyzer = ZipAnalyzer(source)
+        analyzer.analyze()
+
+        if fuse:
+            # 3) extract + rebuild tek geçişte
+            log("\n[AUTO] Adım 3: Diske çıkarmadan doğrudan yeni ZIP'e aktarma (fuse)")
+            repacker = ZipStreamRepacker(source, fixed_zip_path, verbose=verbose, jobs=jobs)
+            success_rebuild = repacker.repack()
+        else:
+            # 3) CRC’yi görmezden gelerek extract
+            log("\n[AUTO] Adım 3: CRC hatalarını görmezden gelerek çıkarma (best-effort)")
+            extractor = ZipExtractor(source, extract_dir, verbose=verbose, jobs=jobs)
+            success_extract = extractor.extract_best_effort()
+            if not success_extract:
+                log("[AUTO] Uyarı: Extract işlemi başarısız veya eksik oldu.")
+    finally:
+        if isinstance(source, zipfile.ZipFile):
+            source.close()
+
+    if not fuse:
+        # 4) Yeni ZIP oluşturma
+        log("\n[AUTO] Adım 4: Çıkarılan dosyalardan yeni ZIP oluşturma (rebuild)")
+        rebuilder = ZipRebuilder(
+            extract_dir,
+            fixed_zip_path,
+            raw_source=zip_path,
+            raw_entries=extractor.clean_entries,
+            jobs=jobs,
+        )
+        success_rebuild = rebuilder.rebuild()
+
     if success_rebuild:
         log(f"[AUTO] Yeni temiz ZIP: {fixed_zip_path}")
     else:
@@ -400,8 +1159,29 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="fixzip64 modunda sadece ne olacağını göster, dosyayı değiştirme",
     )
+    p.add_argument(
+        "--fuse",
+        action="store_true",
+        help="auto modunda extract + rebuild adımlarını diske çıkarmadan tek geçişte yap",
+    )
+    p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="extract/rebuild için paralel işçi sayısı (varsayılan: CPU çekirdek sayısı)",
+    )
+    p.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Giriş bazlı hatalarda tam traceback göster",
+    )
 
-    return p.parse_args(argv)
+    args = p.parse_args(argv)
+    if args.jobs < 1:
+        p.error("--jobs en az 1 olmalı")
+    return args
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -417,7 +1197,14 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     # AUTO
     if args.mode == "auto":
-        auto_repair_pipeline(zip_path, work_dir=work_dir, fixed_zip_path=fixed_zip_path)
+        auto_repair_pipeline(
+            zip_path,
+            work_dir=work_dir,
+            fixed_zip_path=fixed_zip_path,
+            verbose=args.verbose,
+            fuse=args.fuse,
+            jobs=args.jobs,
+        )
         return 0
 
     # CHECK
@@ -436,7 +1223,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     if args.mode == "extract":
         if work_dir is None:
             work_dir = zip_path.parent / (zip_path.stem + "_extracted")
-        extractor = ZipExtractor(zip_path, work_dir)
+        extractor = ZipExtractor(zip_path, work_dir, verbose=args.verbose, jobs=args.jobs)
         ok = extractor.extract_best_effort()
         return 0 if ok else 1
 
@@ -447,7 +1234,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             return 1
         if fixed_zip_path is None:
             fixed_zip_path = work_dir.parent / (zip_path.stem + ".repacked.zip")
-        rebuilder = ZipRebuilder(work_dir, fixed_zip_path)
+        rebuilder = ZipRebuilder(work_dir, fixed_zip_path, jobs=args.jobs)
         ok = rebuilder.rebuild()
         return 0 if ok else 1
 
@@ -456,4 +1243,7 @@ def main(argv: Optional[List[str]] = None) -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    try:
+        sys.exit(main())
+    finally:
+        _logger.flush()